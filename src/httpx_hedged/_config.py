@@ -30,6 +30,8 @@ def _validate_common(config: HedgeConfig | EndpointConfig) -> None:
         )
     if config.min_delay is not None and config.min_delay < 0:
         raise ValueError(f"min_delay must be >= 0, got {config.min_delay}")
+    if config.max_delay is not None and config.max_delay < 0:
+        raise ValueError(f"max_delay must be >= 0, got {config.max_delay}")
     if config.warmup_requests is not None and config.warmup_requests < 0:
         raise ValueError(f"warmup_requests must be >= 0, got {config.warmup_requests}")
     if config.warmup_delay is not None and config.warmup_delay < 0:
@@ -107,6 +109,12 @@ class HedgeConfig:
     #: Floor on the hedge delay in seconds.
     min_delay: float = 0.001
 
+    #: Ceiling in seconds on the hedge delay learned from the sketch, e.g. a
+    #: latency SLO the hedge should fire by even when the backend's own
+    #: percentile has drifted above it. None means uncapped. ``min_delay``
+    #: still wins if the two conflict.
+    max_delay: float | None = None
+
     #: Number of initial requests using a fixed delay before the sketch
     #: is trusted.
     warmup_requests: int = 20
@@ -154,6 +162,10 @@ class EndpointConfig:
     #: Floor on the hedge delay in seconds.
     min_delay: float | None = None
 
+    #: Ceiling in seconds on the hedge delay learned from the sketch. Not
+    #: applied to ``hedge_delay``.
+    max_delay: float | None = None
+
     #: Number of initial requests using a fixed delay before the sketch
     #: is trusted.
     warmup_requests: int | None = None
@@ -181,12 +193,13 @@ class EffectiveConfig:
     """Fully-resolved hedge configuration for a single key.
 
     Every "inherit the default" field from ``EndpointConfig`` has been
-    resolved away by ``resolve()``. ``estimated_rps`` and ``hedge_delay``
-    stay ``Optional`` here regardless, since their ``None`` means something
-    different than "unresolved": ``estimated_rps=None`` means "auto-estimate
-    from traffic" and ``hedge_delay=None`` means "no hardcoded delay, learn
-    one from the sketch" (see ``is_hardcoded``). Both are real, permanent
-    states, not resolution artifacts.
+    resolved away by ``resolve()``. ``estimated_rps``, ``max_delay``, and
+    ``hedge_delay`` stay ``Optional`` here regardless, since their ``None``
+    means something different than "unresolved": ``estimated_rps=None``
+    means "auto-estimate from traffic", ``max_delay=None`` means "no
+    ceiling", and ``hedge_delay=None`` means "no hardcoded delay, learn one
+    from the sketch" (see ``is_hardcoded``). All are real, permanent states,
+    not resolution artifacts.
     """
 
     percentile: float
@@ -194,6 +207,7 @@ class EffectiveConfig:
     estimated_rps: float | None
     rps_window_duration: float
     min_delay: float
+    max_delay: float | None
     warmup_requests: int
     warmup_delay: float
     window_duration: float
@@ -213,8 +227,9 @@ def resolve(endpoint: EndpointConfig | None, default: HedgeConfig) -> EffectiveC
     """Merge a per-endpoint override onto the transport default.
 
     For each field, the endpoint's value is used if it is not None,
-    otherwise the default's value is used. Cheap enough to call on every
-    request rather than caching the result.
+    otherwise the default's value is used. The transports call this once
+    per registered endpoint, plus once for the default, and reuse the
+    result for every request.
     """
     override = endpoint if endpoint is not None else EndpointConfig()
     return EffectiveConfig(
@@ -225,6 +240,7 @@ def resolve(endpoint: EndpointConfig | None, default: HedgeConfig) -> EffectiveC
             override.rps_window_duration, default.rps_window_duration
         ),
         min_delay=_pick(override.min_delay, default.min_delay),
+        max_delay=_pick(override.max_delay, default.max_delay),
         warmup_requests=_pick(override.warmup_requests, default.warmup_requests),
         warmup_delay=_pick(override.warmup_delay, default.warmup_delay),
         window_duration=_pick(override.window_duration, default.window_duration),
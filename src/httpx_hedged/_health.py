@@ -40,6 +40,15 @@ class CircuitState(Enum):
 class _ErrorWindow:
     """Lazy dual-window success/failure counter, same rotation scheme as sketches."""
 
+    __slots__ = (
+        "_current_failures",
+        "_current_total",
+        "_previous_failures",
+        "_previous_total",
+        "_window_duration",
+        "_window_start",
+    )
+
     def __init__(self, window_duration: float) -> None:
         self._window_duration = window_duration
         self._current_total = 0
@@ -103,6 +112,17 @@ class CircuitBreaker:
             observability section for a logging example.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_config",
+        "_half_open_failures",
+        "_half_open_trials",
+        "_on_open",
+        "_opened_at",
+        "_state",
+        "_window",
+    )
+
     def __init__(
         self,
         config: CircuitBreakerConfig,
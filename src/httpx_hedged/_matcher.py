@@ -58,6 +58,9 @@ class _CompiledRoute:
     regex: re.Pattern[str]
     config: EndpointConfig
     name: str
+    #: The ``Route`` handed back by ``match()``, built once at registration
+    #: rather than per request (it's frozen, so sharing it is safe).
+    route: Route
 
 
 class EndpointMatcher:
@@ -85,11 +88,13 @@ class EndpointMatcher:
         if resolved_name in self._by_name:
             raise ValueError(f"endpoint name already registered: {resolved_name!r}")
 
+        regex = _compile_pattern(path_pattern)
         compiled = _CompiledRoute(
             method=method,
-            regex=_compile_pattern(path_pattern),
+            regex=regex,
             config=config,
             name=resolved_name,
+            route=Route(method, regex.pattern, config, resolved_name),
         )
         self._routes.append(compiled)
         self._by_name[resolved_name] = compiled
@@ -105,14 +110,26 @@ class EndpointMatcher:
         registration order and the first method+path match wins. Returns
         None if nothing matches.
         """
+        compiled = self._match_compiled(request)
+        return compiled.route if compiled is not None else None
+
+    def match_name(self, request: httpx.Request) -> str | None:
+        """Like ``match()``, but return only the matched endpoint's name.
+
+        The transports key everything they cache per endpoint by this
+        name, so this saves them unwrapping ``Route.name``, which is
+        optional on a user-built ``Route`` but always set on a matched one.
+        """
+        compiled = self._match_compiled(request)
+        return compiled.name if compiled is not None else None
+
+    def _match_compiled(self, request: httpx.Request) -> _CompiledRoute | None:
         override = request.extensions.get("hedge_endpoint")
         if override is not None:
             compiled = self._by_name.get(override)
             if compiled is None:
                 raise UnknownHedgeEndpointError(override)
-            return Route(
-                compiled.method, compiled.regex.pattern, compiled.config, compiled.name
-            )
+            return compiled
 
         method = request.method.upper()
         path = request.url.path
@@ -120,10 +137,5 @@ class EndpointMatcher:
             if compiled.method not in ("*", method):
                 continue
             if compiled.regex.fullmatch(path):
-                return Route(
-                    compiled.method,
-                    compiled.regex.pattern,
-                    compiled.config,
-                    compiled.name,
-                )
+                return compiled
         return None
@@ -27,6 +27,8 @@ class RollingRateCounter:
     ``WindowedSketch``, but counts requests rather than latencies.
     """
 
+    __slots__ = ("_current", "_lock", "_previous", "_window_duration", "_window_start")
+
     def __init__(self, window_duration: float = _DEFAULT_WINDOW_DURATION) -> None:
         if window_duration <= 0:
             window_duration = _DEFAULT_WINDOW_DURATION
@@ -36,8 +38,7 @@ class RollingRateCounter:
         self._previous = 0
         self._window_start = time.monotonic()
 
-    def _maybe_rotate_locked(self) -> None:
-        now = time.monotonic()
+    def _maybe_rotate_locked(self, now: float) -> None:
         action = next_action(self._window_start, self._window_duration, now)
         if action is RotateAction.NONE:
             return
@@ -52,9 +53,23 @@ class RollingRateCounter:
     def increment(self) -> None:
         """Record one request."""
         with self._lock:
-            self._maybe_rotate_locked()
+            self._maybe_rotate_locked(time.monotonic())
             self._current += 1
 
+    def increment_and_rate(self, now: float | None = None) -> float:
+        """Record one request and return the updated ``rate_per_second()``,
+        under a single lock acquisition.
+
+        ``now`` is a ``time.monotonic()`` reading the caller already has,
+        saving this the clock read it would otherwise make.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            self._maybe_rotate_locked(now)
+            self._current += 1
+            return self._rate_locked(now)
+
     def rate_per_second(self) -> float:
         """Return the estimated requests-per-second, as a sliding-window average.
 
@@ -67,9 +82,14 @@ class RollingRateCounter:
         previous window's count is still discounted as if it were only
         half-relevant.
         """
+        now = time.monotonic()
         with self._lock:
-            self._maybe_rotate_locked()
-            elapsed = time.monotonic() - self._window_start
-            weight = max(0.0, 1.0 - elapsed / self._window_duration)
-            weighted = self._previous * weight + self._current
-            return weighted / self._window_duration
+            self._maybe_rotate_locked(now)
+            return self._rate_locked(now)
+
+    def _rate_locked(self, now: float) -> float:
+        """Caller must hold ``self._lock``."""
+        elapsed = now - self._window_start
+        weight = max(0.0, 1.0 - elapsed / self._window_duration)
+        weighted = self._previous * weight + self._current
+        return weighted / self._window_duration
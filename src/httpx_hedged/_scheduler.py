@@ -13,11 +13,12 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import math
+import sys
 import time
 from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any, TypeVar, cast
-from urllib.parse import urlparse
 
 from httpx_hedged._bounded import BoundedRegistry
 from httpx_hedged._config import CircuitBreakerConfig, EffectiveConfig
@@ -31,27 +32,34 @@ T = TypeVar("T")
 
 _DEFAULT_RPS_SEED = 100.0
 _SKETCH_RELATIVE_ACCURACY = 0.01
-
-
-def extract_host(url: str) -> str:
-    """Extract a sanitized host key from a URL.
-
-    Returns ``hostname:port`` (when port is present) or just ``hostname``,
-    stripping any userinfo (``user:pass@``) to avoid retaining credentials
-    in per-host keys. IPv6 addresses are bracket-wrapped when a port is
-    present to keep the key unambiguous (e.g. ``[::1]:8080``).
+# How many requests reuse one sketch-derived hedge delay before the quantile
+# is read again. Over a window of hundreds to thousands of samples, a handful
+# of new ones barely move the estimate.
+_DELAY_REFRESH_REQUESTS = 16
+
+
+@functools.lru_cache(maxsize=4096)
+def host_key(raw_host: bytes, port: int | None) -> str:
+    """Build a sanitized host key from an already-parsed ``httpx.URL``'s
+    ``raw_host`` and ``port``.
+
+    Returns ``hostname:port`` (when port is present) or just ``hostname``.
+    Userinfo (``user:pass@``) never reaches it, so no credentials are
+    retained in per-host keys. IPv6 addresses are bracket-wrapped when a
+    port is present to keep the key unambiguous (e.g. ``[::1]:8080``).
+
+    The transports call this on every request, so it skips re-serializing
+    and re-parsing the URL, and is memoized: a client talks to a handful of
+    hosts, so nearly every call is a cache hit. httpx leaves ``port`` as
+    None for the scheme's default port, so ``https://example.com:443`` and
+    ``https://example.com`` share one key.
     """
-    parsed = urlparse(url)
-    hostname = parsed.hostname or ""
-    try:
-        port = parsed.port
-    except ValueError:
-        port = None
+    hostname = raw_host.decode("ascii")
     if port is not None:
         if ":" in hostname:
             return f"[{hostname}]:{port}"
         return f"{hostname}:{port}"
-    return hostname or url
+    return hostname
 
 
 class _EndpointState:
@@ -63,15 +71,49 @@ class _EndpointState:
     under the sync scheduler's worker threads a racing ``+= 1`` can
     occasionally lose an increment, which at worst extends the warmup phase
     by a request; that is not worth a per-request lock on the async path.
+
+    ``fixed_delay`` and ``warmup_delay`` are the hardcoded and warmup hedge
+    delays with ``min_delay`` already applied. Neither depends on traffic,
+    so they're resolved once here rather than on every request.
+
+    ``cached_delay`` is the last sketch-derived hedge delay, reused for the
+    next ``refreshes_in`` requests before the sketch is queried again, or
+    sooner once the sketch's window has rotated or reset past
+    ``cached_generation``, the generation it was derived from. Like
+    ``counter``, ``refreshes_in`` is unlocked; a lost decrement just reuses
+    the cached delay for one more request.
     """
 
+    __slots__ = (
+        "cached_delay",
+        "cached_generation",
+        "config",
+        "counter",
+        "fixed_delay",
+        "rate_counter",
+        "refreshes_in",
+        "sketch",
+        "stats",
+        "token_bucket",
+        "warmup_delay",
+    )
+
     def __init__(self, config: EffectiveConfig, stats: Stats) -> None:
         self.config = config
+        self.fixed_delay = (
+            max(config.hedge_delay, config.min_delay)
+            if config.hedge_delay is not None
+            else None
+        )
+        self.warmup_delay = max(config.warmup_delay, config.min_delay)
         self.sketch = WindowedSketch(
             relative_accuracy=_SKETCH_RELATIVE_ACCURACY,
             window_duration=config.window_duration,
         )
         self.counter = 0
+        self.cached_delay = 0.0
+        self.cached_generation = 0
+        self.refreshes_in = 0
         if config.estimated_rps is not None:
             self.token_bucket = TokenBucket(config.budget_percent, config.estimated_rps)
             self.rate_counter: RollingRateCounter | None = None
@@ -80,33 +122,37 @@ class _EndpointState:
             self.rate_counter = RollingRateCounter(config.rps_window_duration)
         self.stats = stats
 
-    def increment_counter(self) -> None:
-        self.counter += 1
-
 
-def compute_hedge_delay(state: _EndpointState) -> float:
+def compute_hedge_delay(state: _EndpointState, now: float | None = None) -> float:
     """Compute the hedge delay in seconds for the current request on this key.
 
-    Pure function of ``state``, shared verbatim by ``HedgeScheduler`` and
+    Depends only on ``state``, shared verbatim by ``HedgeScheduler`` and
     ``SyncHedgeScheduler``, neither of which touches an async/thread
-    primitive here.
+    primitive here. ``now`` is the request's ``time.monotonic()`` start, if
+    the caller already has one.
     """
-    config = state.config
-    if config.hedge_delay is not None:
-        return max(config.hedge_delay, config.min_delay)
+    if state.fixed_delay is not None:
+        return state.fixed_delay
 
+    config = state.config
     if state.counter <= config.warmup_requests:
         state.stats.increment_warmup()
-        delay = config.warmup_delay
-    else:
-        estimate = state.sketch.quantile(config.percentile)
-        delay = (
-            estimate
-            if estimate > 0 and not math.isnan(estimate)
-            else config.warmup_delay
-        )
+        return state.warmup_delay
 
-    return max(delay, config.min_delay)
+    generation = state.sketch.generation(now)
+    if state.refreshes_in > 0 and generation == state.cached_generation:
+        state.refreshes_in -= 1
+        return state.cached_delay
+
+    estimate = state.sketch.quantile(config.percentile)
+    if math.isnan(estimate) or estimate <= 0:
+        return state.warmup_delay
+    if config.max_delay is not None:
+        estimate = min(estimate, config.max_delay)
+    state.cached_delay = max(estimate, config.min_delay)
+    state.cached_generation = generation
+    state.refreshes_in = _DELAY_REFRESH_REQUESTS - 1
+    return state.cached_delay
 
 
 def begin_request(state: _EndpointState) -> tuple[float, float]:
@@ -117,12 +163,12 @@ def begin_request(state: _EndpointState) -> tuple[float, float]:
     Returns ``(hedge_delay, start)``, where ``start`` is the
     ``time.monotonic()`` timestamp the request's latency is measured from.
     """
+    start = time.monotonic()
     state.stats.increment_total()
-    state.increment_counter()
+    state.counter += 1
     if state.rate_counter is not None:
-        state.rate_counter.increment()
-        state.token_bucket.set_rps(state.rate_counter.rate_per_second())
-    return compute_hedge_delay(state), time.monotonic()
+        state.token_bucket.set_rps(state.rate_counter.increment_and_rate(start))
+    return compute_hedge_delay(state, start), start
 
 
 def record_race_winner(state: _EndpointState, primary_won: bool) -> None:
@@ -137,18 +183,16 @@ def should_hedge(
     state: _EndpointState,
     host: str,
     key: str,
-    can_hedge: bool,
     health: HealthRegistry,
     host_circuit_breaker: CircuitBreakerConfig,
 ) -> bool:
-    """Check the hedge gates: idempotency, circuit breaker, then budget.
+    """Check the hedge gates: circuit breaker, then budget.
 
     Shared by both schedulers; ``health``/``state.token_bucket`` are each
     internally thread-safe already, so this function itself touches no
-    concurrency primitive.
+    concurrency primitive. Idempotency is checked before the race starts,
+    since a request that can never hedge skips the race altogether.
     """
-    if not can_hedge:
-        return False
     if not health.hedging_allowed(
         host, key, host_circuit_breaker, state.config.circuit_breaker
     ):
@@ -160,6 +204,46 @@ def should_hedge(
     return True
 
 
+def record_failure(
+    state: _EndpointState,
+    host: str,
+    key: str,
+    health: HealthRegistry,
+    host_circuit_breaker: CircuitBreakerConfig,
+    start: float,
+) -> None:
+    """Record latency and a failed health outcome for a request that raised."""
+    end = time.monotonic()
+    state.sketch.add(end - start, end)
+    health.record_result(
+        host, key, host_circuit_breaker, state.config.circuit_breaker, False
+    )
+    state.stats.increment_errors()
+
+
+def record_success(
+    state: _EndpointState,
+    host: str,
+    key: str,
+    health: HealthRegistry,
+    host_circuit_breaker: CircuitBreakerConfig,
+    start: float,
+    result: T,
+    classify: Callable[[T], bool],
+) -> T:
+    """Record latency and the classified health outcome for a request that
+    returned, then hand its result back."""
+    end = time.monotonic()
+    state.sketch.add(end - start, end)
+    ok = classify(result)
+    health.record_result(
+        host, key, host_circuit_breaker, state.config.circuit_breaker, ok
+    )
+    if not ok:
+        state.stats.increment_errors()
+    return result
+
+
 def record_outcome(
     state: _EndpointState,
     host: str,
@@ -183,45 +267,60 @@ def record_outcome(
     request callable itself, which is why latency is measured when
     ``get_result`` returns rather than on entry.
     """
-    breaker_cfg = state.config.circuit_breaker
     try:
         result = get_result()
     except Exception:
-        state.sketch.add(time.monotonic() - start)
-        health.record_result(host, key, host_circuit_breaker, breaker_cfg, False)
-        state.stats.increment_errors()
+        record_failure(state, host, key, health, host_circuit_breaker, start)
         raise
+    return record_success(
+        state, host, key, health, host_circuit_breaker, start, result, classify
+    )
+
+
+def _start_task(coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Wrap ``coro`` in a task, on Python 3.12+ running it eagerly up to its
+    first suspension (e.g. the inner transport's first socket wait) rather
+    than only on the next event-loop pass. An eager task that never
+    suspends comes back already done.
+
+    A loop with a custom task factory (e.g. one propagating tracing
+    context) always gets ``loop.create_task``, so the factory still sees
+    every task; those tasks start lazily as usual."""
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is not None:
+        return loop.create_task(coro)
+    if sys.version_info >= (3, 14):
+        return loop.create_task(coro, eager_start=True)
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+    return loop.create_task(coro)
+
+
+def _settle_winner(
+    winner: asyncio.Future[asyncio.Task[T]],
+    tasks: list[asyncio.Task[T]],
+    task: asyncio.Task[T],
+) -> None:
+    """Done-callback racing primary and hedge: the first task to finish wins.
+
+    The other side is cancelled right here, in the same loop pass the winner
+    finished in, rather than only once the waiting coroutine resumes.
+    """
+    if winner.done():
+        return
+    winner.set_result(task)
+    for other in tasks:
+        if other is not task:
+            other.cancel()
 
-    state.sketch.add(time.monotonic() - start)
-    ok = classify(result)
-    health.record_result(host, key, host_circuit_breaker, breaker_cfg, ok)
-    if not ok:
-        state.stats.increment_errors()
-    return result
-
-
-class HedgeScheduler:
-    """Shared async hedge scheduling logic, used by ``HedgedTransport``.
 
-    Manages per-key sketches, warmup counters, rate estimation, token
-    bucket budget, and the race-then-cancel logic. Consults the shared
-    ``HealthRegistry`` to suppress hedging (never the primary request)
-    while a host or endpoint circuit breaker is open.
+class _SchedulerBase:
+    """Per-key state bookkeeping shared by ``HedgeScheduler`` and
+    ``SyncHedgeScheduler``; each adds only its own race on top.
 
-    Args:
-        health: Shared circuit-breaker registry.
-        stats_registry: Shared per-key statistics registry.
-        host_circuit_breaker: Circuit-breaker configuration used for the
-            *host* tier, independent of whichever endpoint's config happens
-            to be resolved for a given request. A host isn't owned by any
-            one endpoint, so its breaker thresholds must not depend on
-            request arrival order (``execute_with_hedge`` always passes
-            this rather than the per-request resolved config for the host
-            side of ``HealthRegistry`` calls).
-        on_hedge_fired: Called with the key each time a hedge request is
-            actually launched, after the idempotency, circuit-breaker, and
-            budget gates have all passed. Intended for metrics; see the
-            README's observability section for an example.
+    ``state_for``/``_lookup`` are unlocked here, which is all the async
+    scheduler needs on its single event-loop thread; the sync scheduler
+    overrides both to take a lock.
     """
 
     def __init__(
@@ -237,17 +336,21 @@ class HedgeScheduler:
         self._on_hedge_fired = on_hedge_fired
         self._states: BoundedRegistry[_EndpointState] = BoundedRegistry()
 
+    def _new_state(self, key: str, config: EffectiveConfig) -> _EndpointState:
+        return _EndpointState(config, self._stats_registry.for_key(key))
+
+    def _lookup(self, key: str) -> _EndpointState | None:
+        return self._states.get(key)
+
     def state_for(self, key: str, config: EffectiveConfig) -> _EndpointState:
         """Get or create the state for a key. ``config`` is only used on creation."""
-        return self._states.get_or_create(
-            key, lambda: _EndpointState(config, self._stats_registry.for_key(key))
-        )
+        return self._states.get_or_create(key, lambda: self._new_state(key, config))
 
     def latency_quantile(self, key: str, q: float) -> float | None:
         """Return the current estimated latency (seconds) at quantile ``q``
         for a tracked key, or None if the key isn't tracked yet or has no
         recorded samples."""
-        state = self._states.get(key)
+        state = self._lookup(key)
         if state is None:
             return None
         estimate = state.sketch.quantile(q)
@@ -257,6 +360,41 @@ class HedgeScheduler:
         """Compute the hedge delay in seconds for the current request on this key."""
         return compute_hedge_delay(state)
 
+
+class HedgeScheduler(_SchedulerBase):
+    """Shared async hedge scheduling logic, used by ``HedgedTransport``.
+
+    Manages per-key sketches, warmup counters, rate estimation, token
+    bucket budget, and the race-then-cancel logic. Consults the shared
+    ``HealthRegistry`` to suppress hedging (never the primary request)
+    while a host or endpoint circuit breaker is open.
+
+    Args:
+        health: Shared circuit-breaker registry.
+        stats_registry: Shared per-key statistics registry.
+        host_circuit_breaker: Circuit-breaker configuration used for the
+            *host* tier, independent of whichever endpoint's config happens
+            to be resolved for a given request. A host isn't owned by any
+            one endpoint, so its breaker thresholds must not depend on
+            request arrival order (``execute_with_hedge`` always passes
+            this rather than the per-request resolved config for the host
+            side of ``HealthRegistry`` calls).
+        on_hedge_fired: Called with the key each time a hedge request is
+            actually launched, after the idempotency, circuit-breaker, and
+            budget gates have all passed. Intended for metrics; see the
+            README's observability section for an example.
+    """
+
+    def __init__(
+        self,
+        health: HealthRegistry,
+        stats_registry: StatsRegistry,
+        host_circuit_breaker: CircuitBreakerConfig | None = None,
+        on_hedge_fired: Callable[[str], None] | None = None,
+    ) -> None:
+        super().__init__(health, stats_registry, host_circuit_breaker, on_hedge_fired)
+        self._cleanup_tasks: set[asyncio.Task[None]] = set()
+
     async def execute_with_hedge(
         self,
         *,
@@ -268,6 +406,7 @@ class HedgeScheduler:
         classify: Callable[[T], bool],
         can_hedge: bool,
         discard: Callable[[T], Awaitable[None]] | None = None,
+        timeout: float | None = None,
     ) -> T:
         """Execute the primary request with hedge racing logic.
 
@@ -285,7 +424,13 @@ class HedgeScheduler:
                 task's already-completed result (e.g. closing an
                 ``httpx.Response`` to release its pooled connection) when
                 the primary and hedge happen to finish in the same
-                event-loop pass.
+                event-loop pass. Runs in the background, after the winner
+                has already been returned.
+            timeout: A heuristic horizon for when the primary is likely
+                to have timed out, or None if there is none. It is not a
+                bound on the primary's run time. A hedge delay at or beyond
+                it is assumed to fire too late to matter, so no hedge is
+                scheduled.
 
         Returns:
             The result from whichever request finishes first.
@@ -293,46 +438,33 @@ class HedgeScheduler:
         state = self.state_for(key, config)
         hedge_delay, start = begin_request(state)
 
-        primary_task: asyncio.Task[T] = asyncio.create_task(
-            cast("Coroutine[Any, Any, T]", primary_func())
-        )
-        hedge_task: asyncio.Task[T] | None = None
-        tasks = {primary_task}
-
-        try:
-            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
-            if not done:
-                if should_hedge(
-                    state,
-                    host,
-                    key,
-                    can_hedge,
-                    self._health,
-                    self._host_circuit_breaker,
-                ):
-                    state.stats.increment_hedged()
-                    if self._on_hedge_fired is not None:
-                        self._on_hedge_fired(key)
-                    hedge_task = asyncio.create_task(
-                        cast("Coroutine[Any, Any, T]", hedge_func())
-                    )
-                    tasks.add(hedge_task)
-                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-            winner_task = (
-                primary_task
-                if primary_task in done
-                else cast("asyncio.Task[T]", hedge_task)
+        if not can_hedge or (timeout is not None and hedge_delay >= timeout):
+            # No hedge will be fired for this request, so await the primary
+            # directly on the caller's task instead of paying for a task,
+            # a timer, and the wait machinery on every such request.
+            try:
+                result = await primary_func()
+            except Exception:
+                record_failure(
+                    state, host, key, self._health, self._host_circuit_breaker, start
+                )
+                raise
+            return record_success(
+                state,
+                host,
+                key,
+                self._health,
+                self._host_circuit_breaker,
+                start,
+                result,
+                classify,
             )
 
-            if hedge_task is not None:
-                record_race_winner(state, winner_task is primary_task)
-                loser_task = hedge_task if winner_task is primary_task else primary_task
-                if not loser_task.done():
-                    loser_task.cancel()
-                await asyncio.wait({loser_task})
-                await self._discard(loser_task, discard)
-
+        primary_task = _start_task(cast("Coroutine[Any, Any, T]", primary_func()))
+        if primary_task.done():
+            # Started eagerly and finished without ever suspending (e.g. a
+            # response served without touching the network), so there is
+            # no race to set up at all.
             return record_outcome(
                 state,
                 host,
@@ -340,21 +472,131 @@ class HedgeScheduler:
                 self._health,
                 self._host_circuit_breaker,
                 start,
-                winner_task.result,
+                primary_task.result,
                 classify,
             )
-        finally:
-            # Reached on the happy path too, where every task is already
-            # done and this is a no-op. But if this coroutine itself is
-            # cancelled (e.g. the caller wrapped the request in a timeout)
-            # while blocked on one of the awaits above, asyncio.wait does
-            # not cancel the tasks it was waiting on, so they'd otherwise
-            # keep running detached, holding a pooled connection open.
-            pending = {task for task in tasks if not task.done()}
-            for task in pending:
-                task.cancel()
-            if pending:
-                await asyncio.wait(pending)
+
+        # Whichever task finishes first settles ``winner`` from its
+        # done-callback and cancels the other side there, so waiting on the
+        # race is a single await on one future rather than asyncio.wait()'s
+        # per-call waiter sets. The hedge itself is launched from a timer
+        # callback, so a request whose primary wins (the common case) costs
+        # one TimerHandle, cancelled with the primary's finish, rather than
+        # a timed wait.
+        loop = asyncio.get_running_loop()
+        winner: asyncio.Future[asyncio.Task[T]] = loop.create_future()
+        tasks = [primary_task]
+        primary_task.add_done_callback(functools.partial(_settle_winner, winner, tasks))
+        hedge_timer = loop.call_later(
+            hedge_delay, self._fire_hedge, state, host, key, hedge_func, tasks, winner
+        )
+        # Drop the timer the moment the primary finishes, rather than when
+        # this coroutine next resumes, so it never wakes the loop just to
+        # find there's nothing left to hedge.
+        primary_task.add_done_callback(lambda _: hedge_timer.cancel())
+
+        try:
+            winner_task = await winner
+        except BaseException:
+            # This coroutine itself was cancelled (e.g. the caller wrapped
+            # the request in a timeout) while blocked on the race, or
+            # launching the hedge failed. Nothing cancels the racing tasks
+            # on its behalf, so they'd otherwise keep running detached,
+            # holding a pooled connection open. They're torn down in the
+            # background like any loser, so the caller's own cancellation
+            # isn't held up waiting on theirs. That includes a task that
+            # already finished in the same loop pass the caller was
+            # cancelled in: its result was never handed to anyone, so it
+            # still needs discarding.
+            hedge_timer.cancel()
+            self._release(tasks, discard)
+            raise
+
+        if len(tasks) > 1:
+            record_race_winner(state, winner_task is primary_task)
+            loser_task = tasks[1] if winner_task is primary_task else primary_task
+            self._release([loser_task], discard)
+        # Otherwise the primary won before any hedge launched, the common
+        # case, and there is no loser to clean up at all.
+
+        return record_outcome(
+            state,
+            host,
+            key,
+            self._health,
+            self._host_circuit_breaker,
+            start,
+            winner_task.result,
+            classify,
+        )
+
+    def _fire_hedge(
+        self,
+        state: _EndpointState,
+        host: str,
+        key: str,
+        hedge_func: Callable[[], Awaitable[T]],
+        tasks: list[asyncio.Task[T]],
+        winner: asyncio.Future[asyncio.Task[T]],
+    ) -> None:
+        """Timer callback: launch the hedge once the hedge delay elapses, if
+        the primary is still running and every hedge gate passes.
+
+        An exception from ``on_hedge_fired`` or from starting the hedge is
+        handed to the waiting caller through ``winner``, just as it would
+        have propagated before the hedge moved onto a timer callback.
+        """
+        if winner.done() or tasks[0].done():
+            return
+        try:
+            if not should_hedge(
+                state, host, key, self._health, self._host_circuit_breaker
+            ):
+                return
+            state.stats.increment_hedged()
+            if self._on_hedge_fired is not None:
+                self._on_hedge_fired(key)
+            hedge_task = _start_task(cast("Coroutine[Any, Any, T]", hedge_func()))
+        except Exception as exc:
+            winner.set_exception(exc)
+            return
+        tasks.append(hedge_task)
+        hedge_task.add_done_callback(functools.partial(_settle_winner, winner, tasks))
+
+    def _release(
+        self,
+        tasks: list[asyncio.Task[T]],
+        discard: Callable[[T], Awaitable[None]] | None,
+    ) -> None:
+        """Cancel losing tasks and finish tearing them down in the background.
+
+        Awaiting a loser inline would make the caller wait out the
+        cancellation (including the inner transport's socket teardown)
+        before getting the winner back, adding exactly the kind of tail
+        latency hedging exists to remove. Every task released together
+        shares one cleanup task, so tearing down both sides of an
+        abandoned race costs one background task, not one per side. It's
+        tracked on the scheduler so it isn't garbage-collected mid-flight
+        and so ``aclose()`` can wait for it.
+        """
+        for task in tasks:
+            task.cancel()
+        cleanup = asyncio.create_task(self._discard_when_done(tasks, discard))
+        self._cleanup_tasks.add(cleanup)
+        cleanup.add_done_callback(self._cleanup_tasks.discard)
+
+    async def _discard_when_done(
+        self,
+        tasks: list[asyncio.Task[T]],
+        discard: Callable[[T], Awaitable[None]] | None,
+    ) -> None:
+        # asyncio.wait() still parks for a loop pass on tasks that are
+        # already done, as a loser that finished alongside the winner is.
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            await asyncio.wait(pending)
+        for task in tasks:
+            await self._discard(task, discard)
 
     async def _discard(
         self, task: asyncio.Task[T], discard: Callable[[T], Awaitable[None]] | None
@@ -372,5 +614,7 @@ class HedgeScheduler:
             with contextlib.suppress(Exception):
                 await discard(task.result())
 
-    def close(self) -> None:
-        """Noop."""
+    async def aclose(self) -> None:
+        """Wait for any losing task still being torn down in the background."""
+        if self._cleanup_tasks:
+            await asyncio.wait(set(self._cleanup_tasks))
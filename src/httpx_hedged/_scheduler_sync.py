@@ -6,15 +6,15 @@ since a sync ``httpx.Client`` has no event loop to schedule coroutines on.
 
 The one real behavioral difference from the async scheduler: a losing OS
 thread blocked on a socket read cannot be interrupted the way
-``asyncio.Task.cancel()`` interrupts a coroutine at its next ``await``. So
-unlike the async scheduler (which always resolves the loser, by cancelling
-and awaiting it, before returning), this scheduler returns the winner's
-result immediately and lets the loser finish in the background whenever its
-blocking call happens to return, discarding its result via a done-callback
-at that point. ``loser_future.cancel()`` is still attempted first, but it
-only succeeds if the loser is still queued and hasn't started running yet
-(e.g. it never got a worker thread before losing); once a thread is mid
-socket-read, cancellation is a no-op.
+``asyncio.Task.cancel()`` interrupts a coroutine at its next ``await``. Both
+schedulers return the winner's result immediately without waiting on the
+loser, but where the async scheduler's loser is cancelled and torn down
+almost at once, this scheduler's loser keeps running in the background
+until its blocking call happens to return, its result discarded via a
+done-callback at that point. ``loser_future.cancel()`` is still attempted
+first, but it only succeeds if the loser is still queued and hasn't
+started running yet (e.g. it never got a worker thread before losing);
+once a thread is mid socket-read, cancellation is a no-op.
 
 This means hedging through this scheduler *without a request timeout
 configured on the inner transport is unsafe*: a losing primary or hedge with
@@ -26,19 +26,19 @@ piling up exhausts the thread pool. Always pair this with an
 from __future__ import annotations
 
 import contextlib
-import math
+import functools
 import threading
 from collections.abc import Callable
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
-from typing import TypeVar, cast
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import TypeVar
 
-from httpx_hedged._bounded import BoundedRegistry
 from httpx_hedged._config import CircuitBreakerConfig, EffectiveConfig
 from httpx_hedged._health import HealthRegistry
 from httpx_hedged._scheduler import (
     _EndpointState,
+    _SchedulerBase,
     begin_request,
-    compute_hedge_delay,
     record_outcome,
     record_race_winner,
     should_hedge,
@@ -53,7 +53,15 @@ T = TypeVar("T")
 _DEFAULT_MAX_WORKERS = 200
 
 
-class SyncHedgeScheduler:
+def _settle_winner(winner: Future[Future[T]], future: Future[T]) -> None:
+    """Done-callback racing primary and hedge: the first future to finish
+    wins. Runs on whichever thread completes ``future``, so a near-tie is
+    settled by ``set_result`` itself rejecting the second caller."""
+    with contextlib.suppress(InvalidStateError):
+        winner.set_result(future)
+
+
+class SyncHedgeScheduler(_SchedulerBase):
     """Shared sync hedge scheduling logic, used by ``SyncHedgedTransport``.
 
     See the module docstring for how loser-thread handling differs from the
@@ -86,11 +94,7 @@ class SyncHedgeScheduler:
         max_workers: int | None = None,
         executor: ThreadPoolExecutor | None = None,
     ) -> None:
-        self._health = health
-        self._stats_registry = stats_registry
-        self._host_circuit_breaker = host_circuit_breaker or CircuitBreakerConfig()
-        self._on_hedge_fired = on_hedge_fired
-        self._states: BoundedRegistry[_EndpointState] = BoundedRegistry()
+        super().__init__(health, stats_registry, host_circuit_breaker, on_hedge_fired)
         self._states_lock = threading.Lock()
         self._executor = executor or ThreadPoolExecutor(
             max_workers=max_workers or _DEFAULT_MAX_WORKERS
@@ -105,24 +109,11 @@ class SyncHedgeScheduler:
         thread and needs no lock here.
         """
         with self._states_lock:
-            return self._states.get_or_create(
-                key, lambda: _EndpointState(config, self._stats_registry.for_key(key))
-            )
+            return super().state_for(key, config)
 
-    def latency_quantile(self, key: str, q: float) -> float | None:
-        """Return the current estimated latency (seconds) at quantile ``q``
-        for a tracked key, or None if the key isn't tracked yet or has no
-        recorded samples."""
+    def _lookup(self, key: str) -> _EndpointState | None:
         with self._states_lock:
-            state = self._states.get(key)
-        if state is None:
-            return None
-        estimate = state.sketch.quantile(q)
-        return None if math.isnan(estimate) else estimate
-
-    def compute_hedge_delay(self, state: _EndpointState) -> float:
-        """Compute the hedge delay in seconds for the current request on this key."""
-        return compute_hedge_delay(state)
+            return super()._lookup(key)
 
     def execute_with_hedge(
         self,
@@ -135,6 +126,7 @@ class SyncHedgeScheduler:
         classify: Callable[[T], bool],
         can_hedge: bool,
         discard: Callable[[T], None] | None = None,
+        timeout: float | None = None,
     ) -> T:
         """Execute the primary request with hedge racing logic.
 
@@ -147,8 +139,8 @@ class SyncHedgeScheduler:
         state = self.state_for(key, config)
         hedge_delay, start = begin_request(state)
 
-        if not can_hedge:
-            # A hedge can never fire for this request, so skip the executor
+        if not can_hedge or (timeout is not None and hedge_delay >= timeout):
+            # No hedge will be fired for this request, so skip the executor
             # race entirely and run the primary on the calling thread; a
             # write-heavy workload would otherwise burn two threads per
             # request for no possible benefit. record_outcome measures
@@ -165,27 +157,26 @@ class SyncHedgeScheduler:
                 classify,
             )
 
+        # Whichever future finishes first settles ``winner`` from its
+        # done-callback, so each wait below blocks on one future instead of
+        # registering a fresh waiter on every raced future, the way
+        # concurrent.futures.wait() does on each call.
+        winner: Future[Future[T]] = Future()
+        settle = functools.partial(_settle_winner, winner)
         primary_future: Future[T] = self._executor.submit(primary_func)
+        primary_future.add_done_callback(settle)
         hedge_future: Future[T] | None = None
-        futures = {primary_future}
 
-        done, _ = wait(futures, timeout=hedge_delay)
-        if not done:
-            if should_hedge(
-                state, host, key, can_hedge, self._health, self._host_circuit_breaker
-            ):
+        try:
+            winner_future = winner.result(timeout=hedge_delay)
+        except FuturesTimeoutError:
+            if should_hedge(state, host, key, self._health, self._host_circuit_breaker):
                 state.stats.increment_hedged()
                 if self._on_hedge_fired is not None:
                     self._on_hedge_fired(key)
                 hedge_future = self._executor.submit(hedge_func)
-                futures.add(hedge_future)
-            done, _ = wait(futures, return_when=FIRST_COMPLETED)
-
-        winner_future = (
-            primary_future
-            if primary_future in done
-            else cast("Future[T]", hedge_future)
-        )
+                hedge_future.add_done_callback(settle)
+            winner_future = winner.result()
 
         if hedge_future is not None:
             record_race_winner(state, winner_future is primary_future)
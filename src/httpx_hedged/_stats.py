@@ -14,6 +14,19 @@ class Stats:
     All fields use a lock for atomic updates and are safe to read concurrently.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_lock",
+        "budget_exhausted",
+        "circuit_blocked",
+        "errors",
+        "hedge_wins",
+        "hedged_requests",
+        "primary_wins",
+        "total_requests",
+        "warmup_requests",
+    )
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self.total_requests: int = 0
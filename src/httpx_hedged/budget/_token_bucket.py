@@ -18,6 +18,16 @@ class TokenBucket:
         estimated_rps: Expected requests per second.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_budget_percent",
+        "_last_refill",
+        "_lock",
+        "_max_burst",
+        "_rate",
+        "_tokens",
+    )
+
     def __init__(
         self, budget_percent: float = 10.0, estimated_rps: float = 100.0
     ) -> None:
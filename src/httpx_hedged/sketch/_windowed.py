@@ -5,23 +5,37 @@ from __future__ import annotations
 import math
 import threading
 import time
+from collections import deque
 
-from ddsketch import DDSketch
+from ddsketch import LogCollapsingLowestDenseDDSketch
 
 from httpx_hedged._rotation import RotateAction, next_action
 
 _DEFAULT_WINDOW_DURATION = 30.0  # seconds
+# At 1% accuracy, 1024 bins span a ~10^8 ratio between the lowest and highest
+# sample, far wider than any real latency spread, so the cap only kicks in
+# for pathological outliers and then costs accuracy only at the low end.
+_DEFAULT_BIN_LIMIT = 1024
+# Samples buffered by ``add`` before it takes the lock to fold them in.
+_FLUSH_THRESHOLD = 64
 
 
 class WindowedSketch:
     """Maintains a sliding window over two DDSketches that rotate lazily.
 
-    Quantile queries merge both sketches, giving a window that spans 1x to
+    Quantile queries cover both sketches, giving a window that spans 1x to
     2x the configured duration. ``add`` always writes to the current
-    sketch. Rotation is decided lazily on each call rather than by a
-    background thread/task (see ``httpx_hedged._rotation``), since a
-    service can have many independently-tracked endpoints, and spinning one
-    rotation task per endpoint does not scale.
+    sketch, and also to a running merge of both, so a query reads that
+    merge directly instead of rebuilding it from the pair every time; the
+    merge is only rebuilt, from the previous sketch alone, on rotation.
+    ``add`` itself only appends to a pending buffer (``deque.append`` is
+    atomic, so it needs no lock); buffered samples are folded into the
+    sketches in one locked batch when the buffer fills or before a query
+    reads them, each still landing in the window of its own timestamp.
+    Rotation is decided lazily on each call rather than by a background
+    thread/task (see ``httpx_hedged._rotation``), since a service can have
+    many independently-tracked endpoints, and spinning one rotation task
+    per endpoint does not scale.
 
     The rotation scheme::
 
@@ -34,42 +48,100 @@ class WindowedSketch:
 
     Args:
         relative_accuracy: DDSketch relative accuracy (default: 0.01).
+        bin_limit: Most bins each sketch may hold (default: 1024). Past it,
+            the lowest bins are collapsed together, keeping per-key memory
+            bounded while leaving the upper quantiles hedging reads exact
+            to ``relative_accuracy``.
         window_duration: Rotation interval in seconds (default: 30.0).
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_bin_limit",
+        "_current",
+        "_generation",
+        "_lock",
+        "_merged",
+        "_pending",
+        "_previous",
+        "_relative_accuracy",
+        "_window_duration",
+        "_window_start",
+    )
+
     def __init__(
         self,
         relative_accuracy: float = 0.01,
         window_duration: float = _DEFAULT_WINDOW_DURATION,
+        bin_limit: int = _DEFAULT_BIN_LIMIT,
     ) -> None:
         if window_duration <= 0:
             window_duration = _DEFAULT_WINDOW_DURATION
         self._relative_accuracy = relative_accuracy
+        self._bin_limit = bin_limit
         self._window_duration = window_duration
         self._lock = threading.Lock()
-        self._current = DDSketch(relative_accuracy)
-        self._previous = DDSketch(relative_accuracy)
+        self._current = self._new_sketch()
+        self._previous = self._new_sketch()
+        self._merged = self._new_sketch()
+        self._pending: deque[tuple[float, float]] = deque()
         self._window_start = time.monotonic()
+        self._generation = 0
+
+    def _new_sketch(self) -> LogCollapsingLowestDenseDDSketch:
+        return LogCollapsingLowestDenseDDSketch(
+            self._relative_accuracy, bin_limit=self._bin_limit
+        )
+
+    def _rotate_locked(self, now: float) -> None:
+        """Start a new current sketch. Caller must hold the lock."""
+        self._previous = self._current
+        self._current = self._new_sketch()
+        self._merged = self._new_sketch()
+        self._merged.merge(self._previous)
+        self._window_start = now
+        self._generation += 1
 
-    def _maybe_rotate_locked(self) -> None:
+    def _maybe_rotate_locked(self, now: float | None = None) -> None:
         """Rotate or reset if enough time has passed. Caller must hold the lock."""
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
         action = next_action(self._window_start, self._window_duration, now)
         if action is RotateAction.NONE:
             return
         if action is RotateAction.ROTATE:
-            self._previous = self._current
-            self._current = DDSketch(self._relative_accuracy)
-        else:  # RESET
-            self._previous = DDSketch(self._relative_accuracy)
-            self._current = DDSketch(self._relative_accuracy)
+            self._rotate_locked(now)
+            return
+        # RESET
+        self._previous = self._new_sketch()
+        self._current = self._new_sketch()
+        self._merged = self._new_sketch()
         self._window_start = now
-
-    def add(self, value: float) -> None:
-        """Record a latency sample (in seconds) to the current sketch."""
-        with self._lock:
-            self._maybe_rotate_locked()
+        self._generation += 1
+
+    def _flush_locked(self) -> None:
+        """Fold buffered samples into the sketches. Caller must hold the lock."""
+        pending = self._pending
+        while pending:
+            value, now = pending.popleft()
+            self._maybe_rotate_locked(now)
             self._current.add(value)
+            self._merged.add(value)
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Record a latency sample (in seconds) to the current sketch.
+
+        ``now`` is the ``time.monotonic()`` reading the sample was taken
+        at, if the caller already has one (e.g. the end timestamp of the
+        request it just measured), saving a second clock read. It decides
+        which window the sample lands in once it's folded in.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._pending.append((value, now))
+        if len(self._pending) >= _FLUSH_THRESHOLD:
+            with self._lock:
+                self._flush_locked()
 
     def quantile(self, q: float) -> float:
         """Return the estimated quantile q in [0, 1] over the sliding window.
@@ -77,18 +149,32 @@ class WindowedSketch:
         Returns math.nan if no data has been recorded.
         """
         with self._lock:
+            self._flush_locked()
             self._maybe_rotate_locked()
-            if self._current.count == 0 and self._previous.count == 0:
+            if self._merged.count == 0:
                 return math.nan
-            merged = DDSketch(self._relative_accuracy)
-            merged.merge(self._previous)
-            merged.merge(self._current)
-            value = merged.get_quantile_value(q)
+            value = self._merged.get_quantile_value(q)
             return math.nan if value is None else value
 
+    def generation(self, now: float | None = None) -> int:
+        """Return a counter bumped every time the window rotates or resets.
+
+        A caller that caches something derived from ``quantile`` can compare
+        generations to tell whether the window it was derived from has moved
+        on. Any rotation already due at ``now`` is applied first, so a long
+        idle gap shows up here even if nothing has touched the sketch since;
+        when none is due this reads the counter without taking the lock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if now - self._window_start >= self._window_duration:
+            with self._lock:
+                self._flush_locked()
+                self._maybe_rotate_locked(now)
+        return self._generation
+
     def rotate(self) -> None:
         """Force an immediate rotation. Mostly useful for testing."""
         with self._lock:
-            self._previous = self._current
-            self._current = DDSketch(self._relative_accuracy)
-            self._window_start = time.monotonic()
+            self._flush_locked()
+            self._rotate_locked(time.monotonic())
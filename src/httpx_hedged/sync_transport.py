@@ -21,6 +21,7 @@ request timeout on the inner transport is load-bearing here.
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 
@@ -30,9 +31,11 @@ from httpx_hedged._config import HedgeConfig
 from httpx_hedged._matcher import Route
 from httpx_hedged._scheduler_sync import SyncHedgeScheduler
 from httpx_hedged.transport import (
+    _DEFAULT_LIMITS,
     _classify_for,
     _HedgedTransportCore,
-    _resolve_request,
+    _is_replayable,
+    _timeout_horizon,
 )
 
 
@@ -71,7 +74,7 @@ class SyncHedgedTransport(_HedgedTransportCore, httpx.BaseTransport):
 
     Args:
         inner: The underlying transport to wrap. Defaults to a new
-            ``httpx.HTTPTransport()``.
+            ``httpx.HTTPTransport(limits=limits)``.
         default_config: Hedge configuration used for any request that
             doesn't match a registered endpoint. Defaults to ``HedgeConfig()``.
         routes: Endpoints to register up front (equivalent to calling
@@ -93,6 +96,9 @@ class SyncHedgedTransport(_HedgedTransportCore, httpx.BaseTransport):
             letting this transport create one. Still shut down by
             ``close()`` regardless of who constructed it, matching how
             ``close()`` always closes ``inner`` too.
+        limits: Connection-pool limits for the default inner transport.
+            Ignored if ``inner`` is given. Defaults to the same limits as
+            ``HedgedTransport``.
     """
 
     _scheduler: SyncHedgeScheduler
@@ -106,8 +112,9 @@ class SyncHedgedTransport(_HedgedTransportCore, httpx.BaseTransport):
         on_circuit_open: Callable[[str, str], None] | None = None,
         max_workers: int | None = None,
         executor: ThreadPoolExecutor | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
-        self._inner = inner or httpx.HTTPTransport()
+        self._inner = inner or httpx.HTTPTransport(limits=limits or _DEFAULT_LIMITS)
         self._init_core(default_config, on_circuit_open, routes)
         self._scheduler = SyncHedgeScheduler(
             self._health,
@@ -120,13 +127,11 @@ class SyncHedgedTransport(_HedgedTransportCore, httpx.BaseTransport):
 
     def handle_request(self, request: httpx.Request) -> httpx.Response:
         """Handle an outgoing request with adaptive, per-endpoint hedging."""
-        key, host, resolved, can_hedge = _resolve_request(
-            self._matcher, self._default_config, request
-        )
-
-        def do_request() -> httpx.Response:
-            return self._inner.handle_request(request)
+        key, host, resolved, can_hedge = self._resolve_request(request)
+        if can_hedge and not _is_replayable(request):
+            request.read()
 
+        do_request = functools.partial(self._inner.handle_request, request)
         return self._scheduler.execute_with_hedge(
             key=key,
             host=host,
@@ -136,6 +141,7 @@ class SyncHedgedTransport(_HedgedTransportCore, httpx.BaseTransport):
             classify=_classify_for(resolved),
             can_hedge=can_hedge,
             discard=_close_response,
+            timeout=_timeout_horizon(request),
         )
 
     def close(self) -> None:
@@ -15,6 +15,7 @@ Usage::
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Protocol
 
@@ -23,65 +24,77 @@ import httpx
 from httpx_hedged._config import EffectiveConfig, EndpointConfig, HedgeConfig, resolve
 from httpx_hedged._health import HealthRegistry
 from httpx_hedged._matcher import EndpointMatcher, Route
-from httpx_hedged._scheduler import HedgeScheduler, extract_host
+from httpx_hedged._scheduler import HedgeScheduler, host_key
 from httpx_hedged._stats import StatsRegistry
 
 _IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
 
-
-def _has_body(request: httpx.Request) -> bool:
-    """Whether a request carries a body that a hedge can't safely re-send.
-
-    The primary and hedge both send the same ``httpx.Request`` object; a
-    body backed by a one-shot async stream (e.g. ``content=some_generator``)
-    would be consumed by whichever of the two reads it first, corrupting or
-    failing the other. Idempotent methods essentially never carry a body in
-    normal use, so this only ever changes behavior for that edge case.
+# httpx's default pool ceiling, but keeping every connection alive when idle
+# rather than httpx's default of 20. A hedge briefly holds a second
+# connection and a cancelled loser hands its connection back, so hedged
+# traffic churns through more connections than its request rate suggests;
+# with only 20 kept alive, the rest would be closed on release and
+# re-established (TCP + TLS handshake) by the next burst.
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+
+def _is_replayable(request: httpx.Request) -> bool:
+    """Whether a request's body can safely be sent by both primary and hedge.
+
+    The primary and hedge both send the same ``httpx.Request`` object. An
+    in-memory body (``content=b"..."``, ``json=``, or none at all) is an
+    ``httpx.ByteStream`` that replays the same bytes on every read, but a
+    body backed by a one-shot stream (e.g. ``content=some_generator``)
+    would be consumed by whichever of the two reads it first, corrupting
+    or failing the other. Callers buffer such a body once, before the
+    race, rather than giving up on hedging the request.
     """
-    content_length = request.headers.get("content-length")
-    if content_length not in (None, "0"):
-        return True
-    return request.headers.get("transfer-encoding", "").lower() == "chunked"
+    return isinstance(request.stream, httpx.ByteStream)
 
 
-def _resolve_request(
-    matcher: EndpointMatcher, default_config: HedgeConfig, request: httpx.Request
-) -> tuple[str, str, EffectiveConfig, bool]:
-    """Resolve a request to its hedge key, host, effective config, and hedge
-    eligibility.
+def _timeout_horizon(request: httpx.Request) -> float | None:
+    """A heuristic horizon for when a request's primary is likely to have
+    timed out, from httpx's per-phase ``timeout`` extension.
 
-    Pure computation, independent of sync/async, shared by
-    ``HedgedTransport`` and ``SyncHedgedTransport``.
+    This is the sum of the four phase timeouts. It is not a bound: httpx
+    applies the read and write timeouts to each socket operation, not to
+    the request as a whole, so a response that keeps trickling in can run
+    well past it. It only serves to skip hedges that would almost certainly
+    fire too late to help.
 
-    Returns:
-        ``(key, host, resolved, can_hedge)``.
+    Returns None if the request carries no timeout or any phase is
+    unbounded.
     """
-    host = extract_host(str(request.url))
-    route = matcher.match(request)
+    timeout = request.extensions.get("timeout")
+    if not timeout:
+        return None
+    horizon = 0.0
+    for phase in ("pool", "connect", "write", "read"):
+        seconds = timeout.get(phase)
+        if seconds is None:
+            return None
+        horizon += seconds
+    return horizon
+
+
+def _classify_5xx_as_failure(response: httpx.Response) -> bool:
+    return response.status_code < 500
 
-    if route is not None:
-        key = f"endpoint:{route.name}"
-        resolved = resolve(route.config, default_config)
-    else:
-        key = f"host:{host}"
-        resolved = resolve(None, default_config)
 
-    can_hedge = request.method.upper() in _IDEMPOTENT_METHODS and not _has_body(request)
-    return key, host, resolved, can_hedge
+def _classify_any_as_success(response: httpx.Response) -> bool:
+    return True
 
 
 def _classify_for(resolved: EffectiveConfig) -> Callable[[httpx.Response], bool]:
-    """Build the circuit-breaker success classifier for a resolved config.
+    """Pick the circuit-breaker success classifier for a resolved config.
 
     Shared by both transports so failure-classification policy lives in
-    one place.
+    one place. Both classifiers are module-level functions, so picking one
+    allocates nothing per request.
     """
-    treat_5xx_as_failure = resolved.circuit_breaker.treat_5xx_as_failure
-
-    def classify(response: httpx.Response) -> bool:
-        return not (treat_5xx_as_failure and response.status_code >= 500)
-
-    return classify
+    if resolved.circuit_breaker.treat_5xx_as_failure:
+        return _classify_5xx_as_failure
+    return _classify_any_as_success
 
 
 async def _aclose_response(response: httpx.Response) -> None:
@@ -108,6 +121,10 @@ class _HedgedTransportCore:
         routes: list[Route] | None,
     ) -> None:
         self._default_config = default_config or HedgeConfig()
+        # Each route's key and config are built once, at registration,
+        # rather than on every request it matches.
+        self._default_resolved = resolve(None, self._default_config)
+        self._resolved: dict[str, tuple[str, EffectiveConfig]] = {}
         self._matcher = EndpointMatcher()
         self._stats = StatsRegistry()
         self._health = HealthRegistry(on_circuit_open=on_circuit_open)
@@ -139,7 +156,34 @@ class _HedgedTransportCore:
         Returns the resolved endpoint name (used as the key in ``stats``
         and as the value for ``extensions={"hedge_endpoint": name}``).
         """
-        return self._matcher.register(method, path_pattern, config, name=name)
+        resolved = resolve(config, self._default_config)
+        name = self._matcher.register(method, path_pattern, config, name=name)
+        self._resolved[name] = (f"endpoint:{name}", resolved)
+        return name
+
+    def _resolve_request(
+        self, request: httpx.Request
+    ) -> tuple[str, str, EffectiveConfig, bool]:
+        """Resolve a request to its hedge key, host, effective config, and
+        hedge eligibility.
+
+        Independent of sync/async, shared by ``HedgedTransport`` and
+        ``SyncHedgedTransport``.
+
+        Returns:
+            ``(key, host, resolved, can_hedge)``.
+        """
+        host = host_key(request.url.raw_host, request.url.port)
+        name = self._matcher.match_name(request)
+
+        if name is not None:
+            key, resolved = self._resolved[name]
+        else:
+            key = f"host:{host}"
+            resolved = self._default_resolved
+
+        can_hedge = request.method.upper() in _IDEMPOTENT_METHODS
+        return key, host, resolved, can_hedge
 
     @property
     def stats(self) -> StatsRegistry:
@@ -189,7 +233,7 @@ class HedgedTransport(_HedgedTransportCore, httpx.AsyncBaseTransport):
 
     Args:
         inner: The underlying transport to wrap. Defaults to a new
-            ``httpx.AsyncHTTPTransport()``.
+            ``httpx.AsyncHTTPTransport(limits=limits)``.
         default_config: Hedge configuration used for any request that
             doesn't match a registered endpoint. Defaults to ``HedgeConfig()``.
         routes: Endpoints to register up front (equivalent to calling
@@ -202,6 +246,11 @@ class HedgedTransport(_HedgedTransportCore, httpx.AsyncBaseTransport):
             (``scope`` is ``"host"`` or ``"endpoint"``). Intended for
             alerting; see the README's observability section for an
             example.
+        limits: Connection-pool limits for the default inner transport.
+            Ignored if ``inner`` is given. Defaults to httpx's own 100
+            connections, all of which may be kept alive when idle (httpx's
+            default keeps 20), since hedging's extra, short-lived
+            connections would otherwise be torn down and re-established.
     """
 
     _scheduler: HedgeScheduler
@@ -213,8 +262,11 @@ class HedgedTransport(_HedgedTransportCore, httpx.AsyncBaseTransport):
         routes: list[Route] | None = None,
         on_hedge_fired: Callable[[str], None] | None = None,
         on_circuit_open: Callable[[str, str], None] | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
-        self._inner = inner or httpx.AsyncHTTPTransport()
+        self._inner = inner or httpx.AsyncHTTPTransport(
+            limits=limits or _DEFAULT_LIMITS
+        )
         self._init_core(default_config, on_circuit_open, routes)
         self._scheduler = HedgeScheduler(
             self._health,
@@ -225,13 +277,14 @@ class HedgedTransport(_HedgedTransportCore, httpx.AsyncBaseTransport):
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         """Handle an outgoing request with adaptive, per-endpoint hedging."""
-        key, host, resolved, can_hedge = _resolve_request(
-            self._matcher, self._default_config, request
-        )
-
-        async def do_request() -> httpx.Response:
-            return await self._inner.handle_async_request(request)
-
+        key, host, resolved, can_hedge = self._resolve_request(request)
+        if can_hedge and not _is_replayable(request):
+            await request.aread()
+
+        # Binding the inner transport's method directly, rather than
+        # wrapping it in a nested coroutine function, saves a closure per
+        # request and an extra coroutine frame per attempt.
+        do_request = functools.partial(self._inner.handle_async_request, request)
         return await self._scheduler.execute_with_hedge(
             key=key,
             host=host,
@@ -241,9 +294,10 @@ class HedgedTransport(_HedgedTransportCore, httpx.AsyncBaseTransport):
             classify=_classify_for(resolved),
             can_hedge=can_hedge,
             discard=_aclose_response,
+            timeout=_timeout_horizon(request),
         )
 
     async def aclose(self) -> None:
         """Close the transport and the wrapped inner transport."""
-        self._scheduler.close()
+        await self._scheduler.aclose()
         await self._inner.aclose()
@@ -7,7 +7,7 @@ import pytest
 
 from httpx_hedged import CircuitBreakerConfig, CircuitState, EndpointConfig, HedgeConfig
 from httpx_hedged._config import resolve
-from httpx_hedged.transport import HedgedTransport
+from httpx_hedged.transport import _DEFAULT_LIMITS, HedgedTransport
 from tests.conftest import ScriptedTransport, delayed_response, failing
 
 pytestmark = pytest.mark.asyncio
@@ -25,6 +25,40 @@ async def test_passthrough_returns_response_and_records_stats() -> None:
     await transport.aclose()
 
 
+async def test_default_inner_transport_keeps_idle_connections_alive(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert _DEFAULT_LIMITS.max_keepalive_connections == 100
+    built: list[httpx.Limits] = []
+
+    class RecordingTransport(httpx.AsyncBaseTransport):
+        def __init__(self, *, limits: httpx.Limits) -> None:
+            built.append(limits)
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", RecordingTransport)
+    custom = httpx.Limits(max_keepalive_connections=7)
+    await HedgedTransport().aclose()
+    await HedgedTransport(limits=custom).aclose()
+    assert built == [_DEFAULT_LIMITS, custom]
+
+
+async def test_configs_are_resolved_once_and_reused_across_requests() -> None:
+    transport = HedgedTransport(default_config=HedgeConfig(percentile=0.95))
+    transport.register("GET", "/search", EndpointConfig(percentile=0.5))
+    search = httpx.Request("GET", "https://api.example.com/search")
+    other = httpx.Request("GET", "https://api.example.com/other")
+
+    _key, _host, first, _can_hedge = transport._resolve_request(search)
+    _key, _host, second, _can_hedge = transport._resolve_request(search)
+    assert first is second
+    assert first.percentile == 0.5
+
+    _key, _host, fallback, _can_hedge = transport._resolve_request(other)
+    assert fallback is transport._resolve_request(other)[2]
+    assert fallback.percentile == 0.95
+    await transport.aclose()
+
+
 async def test_two_endpoints_share_one_transport_with_independent_delays() -> None:
     """Regression test for the scenario in the filed hedge-python issue:
 
@@ -135,8 +169,33 @@ async def test_latency_quantile_reflects_traffic_through_the_transport() -> None
     await transport.aclose()
 
 
-async def test_get_with_streamed_body_never_hedges_even_when_slow() -> None:
-    inner = ScriptedTransport([delayed_response(0.05)])
+async def test_hedge_delay_beyond_client_timeout_never_hedges() -> None:
+    # The stub never enforces the timeout itself, so the primary outlives
+    # the hedge delay here. The hedge is skipped anyway: the 0.05s delay is
+    # past the 4 x 0.01s summed phase timeouts, the heuristic horizon by
+    # which a real inner transport has likely timed out.
+    inner = ScriptedTransport([delayed_response(0.08)])
+    transport = HedgedTransport(inner=inner, default_config=HedgeConfig(min_delay=0.0))
+    transport.register("GET", "/slow", EndpointConfig(hedge_delay=0.05))
+
+    async with httpx.AsyncClient(transport=transport, timeout=0.01) as client:
+        resp = await client.get("https://api.example.com/slow")
+    assert resp.status_code == 200
+    assert inner.calls == 1
+    snap = transport.stats.snapshot("endpoint:GET /slow")
+    assert snap is not None
+    assert snap.hedged_requests == 0
+    await transport.aclose()
+
+
+async def test_get_with_streamed_body_is_buffered_and_replayed_to_the_hedge() -> None:
+    bodies: list[bytes] = []
+
+    async def read_body_then_respond(request: httpx.Request) -> httpx.Response:
+        bodies.append(b"".join([part async for part in request.stream]))
+        return await delayed_response(0.05)(request)
+
+    inner = ScriptedTransport([read_body_then_respond])
     transport = HedgedTransport(
         inner=inner,
         default_config=HedgeConfig(
@@ -151,12 +210,13 @@ async def test_get_with_streamed_body_never_hedges_even_when_slow() -> None:
     async with httpx.AsyncClient(transport=transport) as client:
         resp = await client.send(request)
     assert resp.status_code == 200
-    # A hedge would have sent the same one-shot stream twice; the gate
-    # must have suppressed it, so the inner transport only sees one call.
-    assert inner.calls == 1
+    # The one-shot stream was buffered before the race, so the hedge sees
+    # the same bytes as the primary rather than an exhausted stream.
+    assert inner.calls == 2
+    assert bodies == [b"streamed", b"streamed"]
     snap = transport.stats.snapshot("host:api.example.com")
     assert snap is not None
-    assert snap.hedged_requests == 0
+    assert snap.hedged_requests == 1
     await transport.aclose()
 
 
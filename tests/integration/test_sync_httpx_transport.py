@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import httpx
 import pytest
 
@@ -116,6 +118,27 @@ def test_post_never_hedges_even_when_slow() -> None:
     transport.close()
 
 
+def test_hedge_delay_beyond_client_timeout_never_hedges() -> None:
+    # The stub never enforces the timeout itself, so the primary outlives
+    # the hedge delay here. The hedge is skipped anyway: the 0.05s delay is
+    # past the 4 x 0.01s summed phase timeouts, the heuristic horizon by
+    # which a real inner transport has likely timed out.
+    inner = SyncScriptedTransport([sync_delayed_response(0.08)])
+    transport = SyncHedgedTransport(
+        inner=inner, default_config=HedgeConfig(min_delay=0.0)
+    )
+    transport.register("GET", "/slow", EndpointConfig(hedge_delay=0.05))
+
+    with httpx.Client(transport=transport, timeout=0.01) as client:
+        resp = client.get("https://api.example.com/slow")
+    assert resp.status_code == 200
+    assert inner.calls == 1
+    snap = transport.stats.snapshot("endpoint:GET /slow")
+    assert snap is not None
+    assert snap.hedged_requests == 0
+    transport.close()
+
+
 def test_latency_quantile_reflects_traffic_through_the_transport() -> None:
     inner = SyncScriptedTransport([sync_delayed_response(0.01)])
     transport = SyncHedgedTransport(
@@ -134,8 +157,17 @@ def test_latency_quantile_reflects_traffic_through_the_transport() -> None:
     transport.close()
 
 
-def test_get_with_streamed_body_never_hedges_even_when_slow() -> None:
-    inner = SyncScriptedTransport([sync_delayed_response(0.05)])
+def test_get_with_streamed_body_is_buffered_and_replayed_to_the_hedge() -> None:
+    bodies: list[bytes] = []
+    bodies_lock = threading.Lock()
+
+    def read_body_then_respond(request: httpx.Request) -> httpx.Response:
+        body = b"".join(request.stream)  # type: ignore[arg-type]
+        with bodies_lock:
+            bodies.append(body)
+        return sync_delayed_response(0.05)(request)
+
+    inner = SyncScriptedTransport([read_body_then_respond])
     transport = SyncHedgedTransport(
         inner=inner,
         default_config=HedgeConfig(
@@ -150,12 +182,13 @@ def test_get_with_streamed_body_never_hedges_even_when_slow() -> None:
     with httpx.Client(transport=transport) as client:
         resp = client.send(request)
     assert resp.status_code == 200
-    # A hedge would have sent the same one-shot stream twice; the gate
-    # must have suppressed it, so the inner transport only sees one call.
-    assert inner.calls == 1
+    # The one-shot stream was buffered before the race, so the hedge sees
+    # the same bytes as the primary rather than an exhausted stream.
+    assert inner.calls == 2
+    assert bodies == [b"streamed", b"streamed"]
     snap = transport.stats.snapshot("host:api.example.com")
     assert snap is not None
-    assert snap.hedged_requests == 0
+    assert snap.hedged_requests == 1
     transport.close()
 
 
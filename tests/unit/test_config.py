@@ -61,6 +61,13 @@ def test_estimated_rps_explicit_pin_is_preserved() -> None:
     assert resolved.estimated_rps == 42.0
 
 
+def test_max_delay_is_inherited_and_overridable() -> None:
+    default = HedgeConfig(max_delay=0.2)
+    assert resolve(None, default).max_delay == 0.2
+    assert resolve(EndpointConfig(max_delay=0.05), default).max_delay == 0.05
+    assert resolve(None, HedgeConfig()).max_delay is None
+
+
 # --- validation ----------------------------------------------------------
 
 
@@ -88,6 +95,8 @@ def test_negative_delays_are_rejected() -> None:
         HedgeConfig(warmup_delay=-0.01)
     with pytest.raises(ValueError, match="hedge_delay"):
         EndpointConfig(hedge_delay=-0.01)
+    with pytest.raises(ValueError, match="max_delay"):
+        EndpointConfig(max_delay=-0.01)
 
 
 def test_non_positive_window_durations_are_rejected() -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Callable
 
 from httpx_hedged._config import CircuitBreakerConfig
@@ -164,3 +165,8 @@ class TestHealthRegistry:
             registry.hedging_allowed("host1", "endpoint:b", host_cfg, endpoint_b_cfg)
             is True
         )
+
+
+def test_breaker_supports_weak_references() -> None:
+    breaker = make_breaker()
+    assert weakref.ref(breaker)() is breaker
@@ -28,12 +28,39 @@ def test_exact_path_match() -> None:
     assert route.name == "GET /api/v1/foo"
 
 
+def test_match_reuses_one_route_object_per_registration() -> None:
+    matcher = EndpointMatcher()
+    matcher.register("GET", "/api/v1/users/{id}", EndpointConfig(), name="user")
+
+    first = matcher.match(make_request("GET", "/api/v1/users/1"))
+    second = matcher.match(make_request("GET", "/api/v1/users/2"))
+    pinned = matcher.match(
+        make_request("GET", "/elsewhere", extensions={"hedge_endpoint": "user"})
+    )
+    assert first is not None
+    assert first is second is pinned
+
+
 def test_no_match_returns_none() -> None:
     matcher = EndpointMatcher()
     matcher.register("GET", "/api/v1/foo", EndpointConfig())
     assert matcher.match(make_request("GET", "/api/v1/bar")) is None
 
 
+def test_match_name_agrees_with_match() -> None:
+    matcher = EndpointMatcher()
+    matcher.register("GET", "/api/v1/users/{id}", EndpointConfig(), name="user")
+
+    assert matcher.match_name(make_request("GET", "/api/v1/users/1")) == "user"
+    assert (
+        matcher.match_name(
+            make_request("GET", "/elsewhere", extensions={"hedge_endpoint": "user"})
+        )
+        == "user"
+    )
+    assert matcher.match_name(make_request("GET", "/api/v1/other")) is None
+
+
 def test_method_must_match() -> None:
     matcher = EndpointMatcher()
     matcher.register("GET", "/api/v1/foo", EndpointConfig())
@@ -65,3 +65,17 @@ def test_long_idle_resets_rate_to_zero(fake_clock: Callable[[float], None]) -> N
         counter.increment()
     fake_clock(25.0)  # beyond 2x window, reset
     assert counter.rate_per_second() == 0.0
+
+
+def test_increment_and_rate_matches_increment_then_rate(
+    fake_clock: Callable[[float], None],
+) -> None:
+    counter = RollingRateCounter(window_duration=10.0)
+    for _ in range(20):
+        counter.increment()
+    fake_clock(11.0)
+    for _ in range(9):
+        counter.increment()
+    fake_clock(5.0)
+    assert counter.increment_and_rate() == pytest.approx((20 * 0.5 + 10) / 10.0)
+    assert counter.rate_per_second() == pytest.approx((20 * 0.5 + 10) / 10.0)
@@ -142,6 +142,33 @@ def test_non_idempotent_never_hedges() -> None:
     assert snap.hedged_requests == 0
 
 
+def test_hedge_delay_beyond_timeout_runs_on_the_calling_thread() -> None:
+    scheduler, _health, stats = make_scheduler()
+    config = hardcoded_config(0.01)
+    threads: list[threading.Thread] = []
+
+    def primary() -> str:
+        threads.append(threading.current_thread())
+        return slow_then_ok(0.03)
+
+    result = scheduler.execute_with_hedge(
+        key="k",
+        host="h",
+        config=config,
+        primary_func=primary,
+        hedge_func=fast_ok,
+        classify=always_ok,
+        can_hedge=True,
+        timeout=0.01,
+    )
+    assert result == "slow-ok"
+    assert threads == [threading.current_thread()]
+    snap = stats.snapshot("k")
+    assert snap is not None
+    assert snap.hedged_requests == 0
+    assert snap.budget_exhausted == 0
+
+
 def test_budget_exhaustion_suppresses_hedge_but_primary_completes() -> None:
     scheduler, _health, stats = make_scheduler()
     config = hardcoded_config(0.01, budget_percent=0.0, estimated_rps=100.0)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from httpx_hedged._stats import StatsRegistry
+import weakref
+
+from httpx_hedged._stats import Stats, StatsRegistry
 
 
 def test_hedge_rate_zero_division_guard() -> None:
@@ -64,3 +66,8 @@ def test_global_snapshot_with_no_keys_is_zeroed() -> None:
     registry = StatsRegistry()
     total = registry.global_snapshot()
     assert total.total_requests == 0
+
+
+def test_stats_supports_weak_references() -> None:
+    stats = Stats()
+    assert weakref.ref(stats)() is stats
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Callable
 
 from httpx_hedged.budget._token_bucket import TokenBucket
@@ -45,3 +46,8 @@ def test_low_rps_still_allows_minimum_burst_of_one(
     bucket = TokenBucket(budget_percent=10.0, estimated_rps=0.0)
     assert bucket.try_acquire() is True
     assert bucket.try_acquire() is False
+
+
+def test_bucket_supports_weak_references() -> None:
+    bucket = TokenBucket(budget_percent=10.0, estimated_rps=100.0)
+    assert weakref.ref(bucket)() is bucket
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import math
 import threading
+import time
+import weakref
 from collections.abc import Callable
 
 import pytest
@@ -44,6 +46,19 @@ def test_quantile_reflects_data_within_window(
     assert sketch.quantile(1.0) == pytest.approx(50.0, rel=0.02)
 
 
+def test_bin_limit_collapses_low_outliers_without_touching_upper_quantiles(
+    fake_clock: Callable[[float], None],
+) -> None:
+    sketch = WindowedSketch(window_duration=30.0, bin_limit=64)
+    sketch.add(1e-9)  # far below the rest, past what 64 bins can span
+    for v in range(1, 101):
+        sketch.add(v / 100.0)
+    assert sketch.quantile(0.9) == pytest.approx(0.9, rel=0.02)
+    assert sketch.quantile(1.0) == pytest.approx(1.0, rel=0.02)
+    # The outlier was folded into the lowest retained bin.
+    assert sketch.quantile(0.0) > 1e-9
+
+
 def test_rotate_keeps_previous_window_data_visible(
     fake_clock: Callable[[float], None],
 ) -> None:
@@ -58,6 +73,31 @@ def test_rotate_keeps_previous_window_data_visible(
     assert q == pytest.approx(20.0, rel=0.02)
 
 
+def test_rotation_drops_samples_older_than_the_previous_window(
+    fake_clock: Callable[[float], None],
+) -> None:
+    sketch = WindowedSketch(window_duration=10.0)
+    sketch.add(100.0)
+    fake_clock(15.0)  # rotate: the 100.0 sample is now "previous"
+    sketch.add(1.0)
+    assert sketch.quantile(1.0) == pytest.approx(100.0, rel=0.02)
+    fake_clock(12.0)  # rotate again: the 100.0 sample falls out entirely
+    assert sketch.quantile(1.0) == pytest.approx(1.0, rel=0.02)
+
+
+def test_buffered_samples_land_in_the_window_of_their_own_timestamp(
+    fake_clock: Callable[[float], None],
+) -> None:
+    sketch = WindowedSketch(window_duration=10.0)
+    sketch.add(100.0)
+    fake_clock(15.0)
+    sketch.add(1.0)
+    fake_clock(12.0)
+    # Neither sample has been folded in before this query, but the 100.0
+    # one was taken two rotations ago and must not be visible.
+    assert sketch.quantile(1.0) == pytest.approx(1.0, rel=0.02)
+
+
 def test_idle_beyond_two_windows_hard_resets(
     fake_clock: Callable[[float], None],
 ) -> None:
@@ -75,3 +115,35 @@ def test_add_after_reset_starts_fresh_window(
     fake_clock(25.0)
     sketch.add(99.0)
     assert sketch.quantile(1.0) == pytest.approx(99.0, rel=0.02)
+
+
+def test_add_with_caller_supplied_now_drives_rotation(
+    fake_clock: Callable[[float], None],
+) -> None:
+    sketch = WindowedSketch(window_duration=10.0)
+    sketch.add(5.0)
+    # A timestamp 25s on (more than 2x window_duration) resets the window
+    # exactly as if the clock itself had been read at that point.
+    sketch.add(99.0, now=time.monotonic() + 25.0)
+    assert sketch.quantile(0.0) == pytest.approx(99.0, rel=0.02)
+
+
+def test_generation_advances_on_rotation_and_reset_even_when_idle(
+    fake_clock: Callable[[float], None],
+) -> None:
+    sketch = WindowedSketch(window_duration=10.0)
+    sketch.add(5.0)
+    assert sketch.generation() == 0
+    fake_clock(5.0)
+    assert sketch.generation() == 0
+    fake_clock(6.0)  # past one window: rotate
+    assert sketch.generation() == 1
+    assert sketch.quantile(0.5) == pytest.approx(5.0, rel=0.02)
+    fake_clock(25.0)  # idle past two windows: reset
+    assert sketch.generation() == 2
+    assert math.isnan(sketch.quantile(0.5))
+
+
+def test_sketch_supports_weak_references() -> None:
+    sketch = WindowedSketch()
+    assert weakref.ref(sketch)() is sketch